@@ -42,17 +42,252 @@ Author / License
 """
 
 import numpy as np
+import os
 import pygame
 import sys
+import threading
+from collections import deque
+
+# The sweep worker runs parallel kernels off the main thread; numba's
+# TBB threading layer (auto-selected when tbb is installed) then
+# deadlocks at interpreter shutdown, so the window never closes. Pin a
+# layer that shuts down cleanly unless the user chose one explicitly.
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True, parallel=True, nogil=True)
+def _metropolis_sweep(buf, prob, u):
+    """Perform one checkerboard Metropolis sweep over the whole lattice.
+
+    `buf` is the (N+2)x(N+2) ghost-padded lattice: the interior is the
+    real lattice and the one-cell halo mirrors the opposite edge, so
+    neighbor access is plain constant-stride indexing with no modulo.
+    The halo is refreshed before each color pass because boundary spins
+    may have flipped in the previous pass.
+
+    Sites are updated in two passes (even and odd sublattices) so that
+    sites updated in parallel never share a neighbor, which keeps the
+    update correct under prange while letting Numba use all cores.
+
+    `prob` is the precomputed acceptance probability exp(-delta_E / T),
+    indexed by the product of the spin and its neighbor sum. Entries for
+    delta_E <= 0 are >= 1, so a single comparison handles both cases.
+    `u` holds one uniform random per site, generated in bulk by the
+    caller so the RNG runs in C once per sweep.
+    """
+    n = buf.shape[0] - 2
+    flips = 0
+    dsum = 0  # sum of s*neighbors over accepted flips; delta_E = 2*J*dsum
+    dm = 0    # change in total spin
+    for color in range(2):
+        # Refresh ghost rows/columns (corners unused by the 4-neighbor stencil)
+        for k in range(1, n + 1):
+            buf[0, k] = buf[n, k]
+            buf[n + 1, k] = buf[1, k]
+            buf[k, 0] = buf[k, n]
+            buf[k, n + 1] = buf[k, 1]
+        for i in prange(1, n + 1):
+            # First interior j of this checkerboard color in row i
+            j0 = 1 + (((i + 1) & 1) ^ color)
+            for j in range(j0, n + 1, 2):
+                s = buf[i, j]
+                snb = s * (buf[i - 1, j] + buf[i + 1, j] +
+                           buf[i, j - 1] + buf[i, j + 1])
+                if u[i - 1, j - 1] < prob[(snb + 4) // 2]:
+                    buf[i, j] = -s
+                    flips += 1
+                    dsum += snb
+                    dm -= 2 * s
+    return flips, dsum, dm
+
+
+def pack_spins(lattice):
+    """Pack a +/-1 spin lattice into 64 spins per uint64 word (bit 1 = up).
+
+    Bit k of word c in a row is the spin in column c*64 + k.
+    """
+    if lattice.shape[1] % 64:
+        raise ValueError("multi-spin coding requires the lattice width to be a multiple of 64")
+    return np.packbits(lattice > 0, axis=-1, bitorder='little').view(np.uint64)
+
+
+def unpack_spins(packed):
+    """Expand a bit-packed lattice back to an int8 lattice of +/-1 spins."""
+    bits = np.unpackbits(packed.view(np.uint8), axis=-1, bitorder='little')
+    return bits.astype(np.int8) * 2 - 1
+
+
+@njit(cache=True, parallel=True)
+def _multispin_sweep(packed, rand3, rand4):
+    """Checkerboard Metropolis sweep on a bit-packed lattice (Jacobs-Rebbi).
+
+    Each uint64 word holds 64 spins. The four neighbor planes are built
+    with shifts, and the per-site count of agreeing neighbors (0..4) is
+    obtained with bitwise half-adders, so one shift/XOR/popcount-style
+    sequence classifies 64 sites at once. For ferromagnetic J > 0 a flip
+    raises the energy only when 3 or 4 neighbors agree; rand3/rand4 are
+    random masks whose bits are set with probability exp(-4J/T) and
+    exp(-8J/T) (rand4 a subset of rand3) and decide those flips.
+    """
+    n, w = packed.shape
+    one = np.uint64(1)
+    s63 = np.uint64(63)
+    even = np.uint64(0x5555555555555555)
+    odd = even << one
+    for color in range(2):
+        for i in prange(n):
+            row = packed[i]
+            north = packed[i - 1]
+            south = packed[(i + 1) % n]
+            # Bits of this checkerboard color in every word of row i
+            cmask = even if (i + color) % 2 == 0 else odd
+            for c in range(w):
+                center = row[c]
+                west = (center << one) | (row[c - 1] >> s63)
+                east = (center >> one) | (row[(c + 1) % w] << s63)
+                a1 = ~(center ^ north[c])
+                a2 = ~(center ^ south[c])
+                a3 = ~(center ^ west)
+                a4 = ~(center ^ east)
+                # Per-lane 3-bit sum of the four agreement planes
+                s1 = a1 ^ a2
+                c1 = a1 & a2
+                s2 = a3 ^ a4
+                c2 = a3 & a4
+                b0 = s1 ^ s2
+                t = s1 & s2
+                b1 = c1 ^ c2 ^ t
+                b2 = (c1 & c2) | (t & (c1 | c2))
+                three = b0 & b1 & ~b2  # exactly 3 agreeing neighbors: delta_E = 4J
+                four = b2              # all 4 agree: delta_E = 8J
+                accept = ~(three | four) | (three & rand3[color, i, c]) | (four & rand4[color, i, c])
+                row[c] = center ^ (accept & cmask)
+
+
+@njit(cache=True)
+def _wolff_step(lat, p_add, seed_i, seed_j, u):
+    """Grow and flip a single Wolff cluster; returns the cluster size.
+
+    Starting from the seed site, same-spin neighbors join the cluster
+    with bond probability p_add = 1 - exp(-2J/T). Sites are flipped as
+    they are pushed, which also marks them visited. `u` is a pre-drawn
+    stream of uniforms, consumed one per neighbor check (at most 4*N^2).
+    """
+    n = lat.shape[0]
+    stack = np.empty((n * n, 2), dtype=np.int32)
+    s = lat[seed_i, seed_j]
+    lat[seed_i, seed_j] = -s
+    stack[0, 0] = seed_i
+    stack[0, 1] = seed_j
+    top = 1
+    size = 0
+    k = 0
+    while top > 0:
+        top -= 1
+        i = stack[top, 0]
+        j = stack[top, 1]
+        size += 1
+        for d in range(4):
+            if d == 0:
+                ni, nj = i - 1 if i > 0 else n - 1, j
+            elif d == 1:
+                ni, nj = i + 1 if i < n - 1 else 0, j
+            elif d == 2:
+                ni, nj = i, j - 1 if j > 0 else n - 1
+            else:
+                ni, nj = i, j + 1 if j < n - 1 else 0
+            if lat[ni, nj] == s and u[k] < p_add:
+                lat[ni, nj] = -s
+                stack[top, 0] = ni
+                stack[top, 1] = nj
+                top += 1
+            k += 1
+    return size
+
 
 class IsingModel:
-    def __init__(self, size=50, temperature=2.0):
+    def __init__(self, size=50, temperature=2.0, seed=None):
+        # The checkerboard sweep needs the two sublattices to stay
+        # disjoint across the periodic wrap, which fails for odd sizes
+        # (opposite edges then share a color and prange races).
+        if size % 2:
+            raise ValueError("lattice size must be even for the checkerboard sweep")
         self.size = size
-        self.temperature = temperature
-        # Initialize lattice with random spins (+1 or -1)
-        self.lattice = np.random.choice([-1, 1], size=(size, size))
+        self._temperature = temperature
+        # Single Generator for all random draws, so a run is
+        # reproducible end to end from one seed
+        self._rng = np.random.default_rng(seed)
+        # The lattice lives in the interior of a ghost-padded buffer
+        # (extended mesh); the halo mirrors the opposite edges so the
+        # sweep kernel avoids modulo arithmetic. Stored as int8 so a
+        # large lattice stays cache-resident (8x smaller than int64).
+        self._buf = np.zeros((size + 2, size + 2), dtype=np.int8)
+        self.lattice = self._buf[1:-1, 1:-1]
         # Coupling constant
-        self.J = 1.0
+        self._J = 1.0
+        self._update_prob()
+        self.randomize()
+
+    def randomize(self):
+        """Fill the lattice with a fresh random spin configuration."""
+        # Write through the view so the padded buffer stays attached
+        self.lattice[:] = self._rng.integers(0, 2, size=(self.size, self.size), dtype=np.int8) * 2 - 1
+        self._refresh_halo()
+        # Running observables, kept in sync incrementally by the sweep
+        self.resync_observables()
+
+    def _refresh_halo(self):
+        """Copy the periodic edges (and corners) into the ghost cells."""
+        buf = self._buf
+        buf[0, 1:-1] = buf[-2, 1:-1]
+        buf[-1, 1:-1] = buf[1, 1:-1]
+        buf[1:-1, 0] = buf[1:-1, -2]
+        buf[1:-1, -1] = buf[1:-1, 1]
+        buf[0, 0] = buf[-2, -2]
+        buf[0, -1] = buf[-2, 1]
+        buf[-1, 0] = buf[1, -2]
+        buf[-1, -1] = buf[1, 1]
+
+    def _update_prob(self):
+        """Precompute acceptance probabilities for the 5 possible energy changes.
+
+        delta_E can only take the values 2*J*s*neighbors with
+        s*neighbors in {-4, -2, 0, 2, 4}, so the exp() is cached here
+        instead of being evaluated N^2 times per sweep.
+        """
+        self._prob = np.exp(-2.0 * self._J * np.arange(-4, 5, 2) / self._temperature)
+
+    @property
+    def temperature(self):
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value):
+        self._temperature = value
+        self._update_prob()
+
+    @property
+    def J(self):
+        return self._J
+
+    @J.setter
+    def J(self, value):
+        self._J = value
+        self._update_prob()
+        # The configuration's energy scales with J
+        self.resync_observables()
+
+    def resync_observables(self):
+        """Recompute the running energy and total spin from the lattice.
+
+        The sweep maintains E and M incrementally; call this after any
+        bulk change to the lattice (reset, multi-spin sweep) or to
+        correct accumulated drift.
+        """
+        self.E = float(self.total_energy())
+        self.M = int(self.lattice.sum())
         
     def energy(self, i, j):
         """Calculate energy at site (i, j)"""
@@ -67,39 +302,79 @@ class IsingModel:
         
     def total_energy(self):
         """Calculate total energy of the lattice"""
-        energy = 0
-        for i in range(self.size):
-            for j in range(self.size):
-                energy += self.energy(i, j)
-        # Avoid double counting
-        return energy / 2
+        lat = self.lattice
+        neighbors = (np.roll(lat, 1, axis=0) + np.roll(lat, -1, axis=0) +
+                     np.roll(lat, 1, axis=1) + np.roll(lat, -1, axis=1))
+        # Divide by 2 to avoid double counting each bond
+        return -self.J * (lat * neighbors).sum() / 2
         
     def magnetization(self):
-        """Calculate absolute magnetization of the lattice"""
-        return np.abs(np.sum(self.lattice)) / (self.size * self.size)
+        """Absolute magnetization per site, from the running total spin"""
+        return abs(self.M) / (self.size * self.size)
         
     def metropolis_step(self):
         """Perform one step of Metropolis algorithm"""
         # Select a random site
-        i, j = np.random.randint(0, self.size, 2)
-        
+        i, j = self._rng.integers(0, self.size, 2)
+
         # Calculate energy change if we flip this spin
         delta_E = -2 * self.energy(i, j)
-        
+
         # Flip if energy decreases or with probability exp(-delta_E/T)
-        if delta_E <= 0 or np.random.random() < np.exp(-delta_E / self.temperature):
+        if delta_E <= 0 or self._rng.random() < np.exp(-delta_E / self.temperature):
             self.lattice[i, j] *= -1
+            # Keep the running observables in step with the flip
+            self.E += delta_E
+            self.M += 2 * int(self.lattice[i, j])
             return True
         return False
     
     def metropolis_sweep(self):
         """Perform a full sweep (NÂ²) of Metropolis steps"""
-        flips = 0
-        for _ in range(self.size * self.size):
-            if self.metropolis_step():
-                flips += 1
+        # Generate all random draws for the sweep in one C-level call
+        u = self._rng.random((self.size, self.size))
+        flips, dsum, dm = _metropolis_sweep(self._buf, self._prob, u)
+        # Fold the accepted flips into the running observables
+        self.E += 2.0 * self._J * dsum
+        self.M += dm
         return flips
 
+    def multispin_sweep(self, n_sweeps=1):
+        """Run Metropolis sweeps using multi-spin coding (64 sites per word).
+
+        Packs the lattice into uint64 words once, runs n_sweeps
+        checkerboard sweeps on the packed representation, and unpacks
+        the result. Requires size to be a multiple of 64 and J > 0.
+        """
+        packed = pack_spins(self.lattice)
+        # Acceptance thresholds for the two energetically unfavorable
+        # cases, expressed on a 16-bit random stream
+        t3 = int(np.exp(-4.0 * self._J / self._temperature) * 65536)
+        t4 = int(np.exp(-8.0 * self._J / self._temperature) * 65536)
+        for _ in range(n_sweeps):
+            r = self._rng.integers(0, 65536, size=(2, self.size, self.size), dtype=np.uint16)
+            rand3 = np.packbits(r < t3, axis=-1, bitorder='little').view(np.uint64)
+            rand4 = np.packbits(r < t4, axis=-1, bitorder='little').view(np.uint64)
+            _multispin_sweep(packed, rand3, rand4)
+        self.lattice[:] = unpack_spins(packed)
+        self.resync_observables()
+
+    def wolff_step(self):
+        """Flip one Wolff cluster; returns the number of spins flipped.
+
+        Near the critical temperature (~2.269 for J=1) single-spin
+        Metropolis suffers critical slowing down; flipping whole
+        correlated clusters decorrelates configurations orders of
+        magnitude faster there.
+        """
+        p_add = 1.0 - np.exp(-2.0 * self._J / self._temperature)
+        seed_i, seed_j = self._rng.integers(0, self.size, 2)
+        u = self._rng.random(4 * self.size * self.size)
+        size = _wolff_step(self.lattice, p_add, seed_i, seed_j, u)
+        self._refresh_halo()
+        self.resync_observables()
+        return size
+
 
 class PyGamePlot:
     """A class to handle plotting data in Pygame"""
@@ -124,22 +399,36 @@ class PyGamePlot:
         # Font for labels
         self.font = pygame.font.SysFont("Arial", 14)
         self.title_font = pygame.font.SysFont("Arial", 18, bold=True)
-        
+
+        # The axes, grid and labels are static for a given range, so
+        # they are rasterized once into this background surface and
+        # blitted per frame instead of being re-drawn line by line
+        self._axis_bg = pygame.Surface((width, height))
+        self._axis_key = None
+        self._tick_cache = {}
+
+    def _render_tick(self, text):
+        """Render a tick label, caching the surface per string."""
+        surf = self._tick_cache.get(text)
+        if surf is None:
+            surf = self.font.render(text, True, (180, 180, 180))
+            self._tick_cache[text] = surf
+        return surf
+
     def draw_plot(self, data, title, x_label, y_label, color=(0, 255, 0), 
                   y_min=None, y_max=None, fixed_y_range=False):
         """Draw a line plot of the data on the surface"""
-        # Clear the surface
-        self.surface.fill(self.bg_color)
-        
         # If no data, just draw the axes and return
         if not data:
-            self._draw_axes(title, x_label, y_label, 0, 1, 0, 1)
+            self._blit_axes(title, x_label, y_label, 0, 1, 0, 1)
             return self.surface
         
+        arr = np.asarray(data, dtype=np.float32)
+
         # Calculate y-axis range
         if y_min is None or y_max is None or not fixed_y_range:
-            calc_y_min = min(data)
-            calc_y_max = max(data)
+            calc_y_min = float(arr.min())
+            calc_y_max = float(arr.max())
             # Ensure min != max to avoid division by zero
             if calc_y_min == calc_y_max:
                 calc_y_min -= 0.1
@@ -149,34 +438,42 @@ class PyGamePlot:
             y_min = calc_y_min - padding if y_min is None else y_min
             y_max = calc_y_max + padding if y_max is None else y_max
         
-        # Draw the axes
-        self._draw_axes(title, x_label, y_label, 0, len(data), y_min, y_max)
+        # Draw the axes (cached background unless the range changed)
+        self._blit_axes(title, x_label, y_label, 0, len(data), y_min, y_max)
         
-        # Draw the line
-        points = []
-        for i, value in enumerate(data):
-            # Convert data coordinates to screen coordinates
-            x = self.margin_left + (i / len(data)) * self.plot_width
-            # Invert y-axis (pygame's y increases downward)
-            y = self.margin_top + self.plot_height - ((value - y_min) / (y_max - y_min)) * self.plot_height
-            points.append((x, y))
-            
+        # Compute all screen coordinates at once (pygame's y increases
+        # downward, hence the inversion)
+        n = len(arr)
+        xs = self.margin_left + np.arange(n) * (self.plot_width / n)
+        ys = (self.margin_top + self.plot_height -
+              ((arr - y_min) / (y_max - y_min)) * self.plot_height)
+
         # Draw line segments connecting the points
-        if len(points) > 1:
-            pygame.draw.lines(self.surface, color, False, points, 2)
+        if n > 1:
+            points = np.column_stack((xs, ys)).astype(np.int32)
+            pygame.draw.lines(self.surface, color, False, points.tolist(), 2)
         
         return self.surface
     
+    def _blit_axes(self, title, x_label, y_label, x_min, x_max, y_min, y_max):
+        """Blit the axis background, rebuilding it only when the range changed."""
+        key = (title, x_label, y_label, x_min, x_max, y_min, y_max)
+        if key != self._axis_key:
+            self._draw_axes(title, x_label, y_label, x_min, x_max, y_min, y_max)
+            self._axis_key = key
+        self.surface.blit(self._axis_bg, (0, 0))
+
     def _draw_axes(self, title, x_label, y_label, x_min, x_max, y_min, y_max):
-        """Draw the axes, grid lines, and labels"""
+        """Draw the axes, grid lines, and labels onto the background surface"""
+        self._axis_bg.fill(self.bg_color)
         # Draw the title
         title_text = self.title_font.render(title, True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, self.margin_top // 2))
-        self.surface.blit(title_text, title_rect)
+        self._axis_bg.blit(title_text, title_rect)
         
         # Draw the x-axis
         pygame.draw.line(
-            self.surface, self.axis_color,
+            self._axis_bg, self.axis_color,
             (self.margin_left, self.margin_top + self.plot_height),
             (self.margin_left + self.plot_width, self.margin_top + self.plot_height), 
             2
@@ -184,7 +481,7 @@ class PyGamePlot:
         
         # Draw the y-axis
         pygame.draw.line(
-            self.surface, self.axis_color,
+            self._axis_bg, self.axis_color,
             (self.margin_left, self.margin_top),
             (self.margin_left, self.margin_top + self.plot_height), 
             2
@@ -196,7 +493,7 @@ class PyGamePlot:
             center=(self.margin_left + self.plot_width // 2, 
                    self.height - self.margin_bottom // 2)
         )
-        self.surface.blit(x_label_text, x_label_rect)
+        self._axis_bg.blit(x_label_text, x_label_rect)
         
         # Draw y-axis label
         y_label_text = self.font.render(y_label, True, (200, 200, 200))
@@ -205,21 +502,21 @@ class PyGamePlot:
             center=(self.margin_left // 2, 
                    self.margin_top + self.plot_height // 2)
         )
-        self.surface.blit(y_label_text, y_label_rect)
+        self._axis_bg.blit(y_label_text, y_label_rect)
         
         # Draw x ticks and grid lines (3 ticks)
         for i in range(4):
             x_pos = self.margin_left + (i / 3) * self.plot_width
             # Tick mark
             pygame.draw.line(
-                self.surface, self.axis_color,
+                self._axis_bg, self.axis_color,
                 (x_pos, self.margin_top + self.plot_height),
                 (x_pos, self.margin_top + self.plot_height + 5), 
                 1
             )
             # Grid line (lighter color)
             pygame.draw.line(
-                self.surface, (100, 100, 100),
+                self._axis_bg, (100, 100, 100),
                 (x_pos, self.margin_top + self.plot_height),
                 (x_pos, self.margin_top), 
                 1
@@ -227,36 +524,36 @@ class PyGamePlot:
             # Tick label
             tick_value = int(x_min + (i / 3) * (x_max - x_min))
             if tick_value < x_max:  # Avoid showing a value beyond our data range
-                tick_text = self.font.render(str(tick_value), True, (180, 180, 180))
+                tick_text = self._render_tick(str(tick_value))
                 tick_rect = tick_text.get_rect(
                     center=(x_pos, self.margin_top + self.plot_height + 15)
                 )
-                self.surface.blit(tick_text, tick_rect)
+                self._axis_bg.blit(tick_text, tick_rect)
         
         # Draw y ticks and grid lines (4 ticks)
         for i in range(5):
             y_pos = self.margin_top + self.plot_height - (i / 4) * self.plot_height
             # Tick mark
             pygame.draw.line(
-                self.surface, self.axis_color,
+                self._axis_bg, self.axis_color,
                 (self.margin_left, y_pos),
                 (self.margin_left - 5, y_pos), 
                 1
             )
             # Grid line (lighter color)
             pygame.draw.line(
-                self.surface, (100, 100, 100),
+                self._axis_bg, (100, 100, 100),
                 (self.margin_left, y_pos),
                 (self.margin_left + self.plot_width, y_pos), 
                 1
             )
             # Tick label
             tick_value = round(y_min + (i / 4) * (y_max - y_min), 2)
-            tick_text = self.font.render(f"{tick_value:.2f}", True, (180, 180, 180))
+            tick_text = self._render_tick(f"{tick_value:.2f}")
             tick_rect = tick_text.get_rect(
                 midright=(self.margin_left - 10, y_pos)
             )
-            self.surface.blit(tick_text, tick_rect)
+            self._axis_bg.blit(tick_text, tick_rect)
 
 
 class IsingSimulation:
@@ -285,14 +582,24 @@ class IsingSimulation:
             -1: (0, 0, 255),    # Blue for spin down
             1: (255, 0, 0)      # Red for spin up
         }
-        
+        # Palette indexed by (spin == +1), plus a reusable surface so the
+        # lattice is rendered with one blit instead of N^2 draw calls
+        self._palette = np.array(
+            [self.spin_colors[-1], self.spin_colors[1]], dtype=np.uint8
+        )
+        self._lattice_surface = pygame.Surface((self.sim_width, self.sim_width))
+
+
         # Create Ising model
         self.model = IsingModel(size=size, temperature=temperature)
         
-        # For tracking energy and magnetization
-        self.energies = [self.model.total_energy() / (self.size * self.size)]
-        self.magnetizations = [self.model.magnetization()]
+        # For tracking energy and magnetization; deques drop old points
+        # in O(1) instead of re-slicing a list every frame
         self.max_data_points = 500  # Max number of points to show in plots
+        self.energies = deque([self.model.E / (self.size * self.size)],
+                              maxlen=self.max_data_points)
+        self.magnetizations = deque([self.model.magnetization()],
+                                    maxlen=self.max_data_points)
         
         # Create plot objects
         self.energy_plot = PyGamePlot(
@@ -308,64 +615,70 @@ class IsingSimulation:
         # For tracking when to update the plots
         self.update_interval = 1  # Update plots every N sweeps
         self.sweep_count = 0
-        
+
+        # Update algorithm; Wolff beats Metropolis near the critical point
+        self.algorithm = "metropolis"
+
         # For screenshot functionality
         self.save_dir = "./"
+
+        # Double buffering: the sweep runs on a background thread (the
+        # numba kernel releases the GIL) and publishes each finished
+        # sweep into this front buffer, which the main thread renders.
+        self._front = self.model.lattice.copy()
+        self._front_lock = threading.Lock()   # guards _front and sweep_count
+        self._model_lock = threading.Lock()   # guards the evolving lattice/params
+        self._running_ev = threading.Event()  # cleared while paused
+        self._running_ev.set()
+        self._stop_ev = threading.Event()
         
     def draw_lattice(self):
-        """Draw the current state of the lattice"""
-        # Create a surface for the lattice
-        lattice_surface = pygame.Surface((self.sim_width, self.sim_width))
-        lattice_surface.fill(self.bg_color)
-        
-        for i in range(self.size):
-            for j in range(self.size):
-                color = self.spin_colors[self.model.lattice[i, j]]
-                pygame.draw.rect(
-                    lattice_surface, 
-                    color,
-                    (j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
-                )
-        
+        """Draw the last published state of the lattice"""
+        # Build an RGB image from the front buffer in one fancy-index
+        # lookup (the worker thread owns the evolving lattice)
+        with self._front_lock:
+            img = self._palette[(self._front == 1).astype(np.uint8)]
+
+        # Upscale each site to cell_size x cell_size pixels
+        if self.cell_size > 1:
+            img = img.repeat(self.cell_size, axis=0).repeat(self.cell_size, axis=1)
+
+        # Pygame expects (width, height, 3); lattice rows are y
+        pygame.surfarray.blit_array(self._lattice_surface, np.transpose(img, (1, 0, 2)))
+
         # Draw the lattice on the left side of the screen
-        self.screen.blit(lattice_surface, (0, 0))
+        self.screen.blit(self._lattice_surface, (0, 0))
     
     def draw_stats(self):
         """Draw statistics on the screen"""
-        energy = self.model.total_energy() / (self.size * self.size)
+        # Read the running observables instead of rescanning the lattice
+        energy = self.model.E / (self.size * self.size)
         mag = self.model.magnetization()
-        
-        # Store for plotting
-        self.energies.append(energy)
-        self.magnetizations.append(mag)
-        
-        # Limit the data points to show in plots
-        if len(self.energies) > self.max_data_points:
-            self.energies = self.energies[-self.max_data_points:]
-            self.magnetizations = self.magnetizations[-self.max_data_points:]
-        
+
         # Create text surfaces
         energy_text = self.font.render(f"Energy/site: {energy:.3f}", True, (255, 255, 255))
         mag_text = self.font.render(f"Magnetization: {mag:.3f}", True, (255, 255, 255))
         temp_text = self.font.render(f"Temperature: {self.model.temperature:.3f}", True, (255, 255, 255))
         j_text = self.font.render(f"Coupling J: {self.model.J:.3f}", True, (255, 255, 255))
         sweep_text = self.font.render(f"Sweeps: {self.sweep_count}", True, (255, 255, 255))
-        
+        algo_text = self.font.render(f"Algorithm: {self.algorithm.capitalize()}", True, (255, 255, 255))
+
         # Position for stats display
         stats_x = 10
-        stats_y = self.height - 100
-        
+        stats_y = self.height - 120
+
         # Draw text at the bottom of the simulation area
         self.screen.blit(energy_text, (stats_x, stats_y))
         self.screen.blit(mag_text, (stats_x, stats_y + 20))
         self.screen.blit(temp_text, (stats_x, stats_y + 40))
         self.screen.blit(j_text, (stats_x, stats_y + 60))
         self.screen.blit(sweep_text, (stats_x, stats_y + 80))
-        
+        self.screen.blit(algo_text, (stats_x, stats_y + 100))
+
         # Draw controls reminder
-        controls_text = self.font.render("SPACE: Pause | UP/DOWN: Temp | LEFT/RIGHT: J | R: Reset | S: Screenshot", 
+        controls_text = self.font.render("SPACE: Pause | UP/DOWN: T | LEFT/RIGHT: J | W: Algorithm | R: Reset | S: Save",
                                        True, (180, 180, 180))
-        controls_rect = controls_text.get_rect(center=(self.width // 2, self.height - 15))
+        controls_rect = controls_text.get_rect(center=(self.sim_width // 2, self.height - 15))
         self.screen.blit(controls_text, controls_rect)
     
     def update_plots(self):
@@ -404,68 +717,151 @@ class IsingSimulation:
         pygame.image.save(self.screen, filename)
         print(f"Screenshot saved as {filename}")
         
+    def _sweep_worker(self, max_steps):
+        """Run sweeps continuously on a background thread.
+
+        The jitted sweep releases the GIL (nogil), so the simulation
+        overlaps with pygame rendering on the main thread. Each finished
+        sweep is published into the front buffer under a short lock;
+        the render path never waits for a sweep in progress.
+        """
+        while not self._stop_ev.is_set() and self.sweep_count < max_steps:
+            # Block while paused, waking periodically to notice a quit
+            if not self._running_ev.wait(timeout=0.05):
+                continue
+            with self._model_lock:
+                if self.algorithm == "wolff":
+                    self.model.wolff_step()
+                else:
+                    self.model.metropolis_sweep()
+            with self._front_lock:
+                np.copyto(self._front, self.model.lattice)
+                self.sweep_count += 1
+
     def run(self, max_steps=10000):
         """Run the simulation"""
-        step = 0
         running = True
         paused = False
-        
+
         # For tracking FPS
         clock = pygame.time.Clock()
-        
-        while running and step < max_steps:
+
+        worker = threading.Thread(target=self._sweep_worker, args=(max_steps,),
+                                  daemon=True)
+        worker.start()
+
+        # The window is split into two independently refreshed regions;
+        # the gap between them (with the separator line) is static and
+        # drawn exactly once.
+        lattice_area = pygame.Rect(0, 0, self.sim_width, self.height)
+        plot_area = pygame.Rect(self.sim_width + 20, 0,
+                                self.plot_width, 2 * self.plot_height + 20)
+        self.screen.fill(self.bg_color)
+        pygame.draw.line(self.screen, (100, 100, 100),
+                        (self.sim_width + 10, 0),
+                        (self.sim_width + 10, self.height),
+                        2)
+        self.draw_lattice()
+        self.update_plots()
+        self.draw_stats()
+        pygame.display.flip()
+
+        # Dirty tracking: redraw a region only when the data behind it
+        # changed, and push just those rectangles to the display
+        last_drawn_sweep = 0
+        last_plot_sweep = 0
+        params_dirty = False
+
+        while running and self.sweep_count < max_steps:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         paused = not paused
+                        if paused:
+                            self._running_ev.clear()
+                        else:
+                            self._running_ev.set()
                     elif event.key == pygame.K_UP:
-                        self.model.temperature += 0.1
+                        with self._model_lock:
+                            self.model.temperature += 0.1
                         pygame.display.set_caption(f"Ising Model Simulation (T={self.model.temperature:.1f})")
+                        params_dirty = True
                     elif event.key == pygame.K_DOWN:
-                        self.model.temperature = max(0.1, self.model.temperature - 0.1)
+                        with self._model_lock:
+                            self.model.temperature = max(0.1, self.model.temperature - 0.1)
                         pygame.display.set_caption(f"Ising Model Simulation (T={self.model.temperature:.1f})")
+                        params_dirty = True
                     elif event.key == pygame.K_RIGHT:
-                        self.model.J += 0.1
+                        with self._model_lock:
+                            self.model.J += 0.1
                         pygame.display.set_caption(f"Ising Model Simulation (T={self.model.temperature:.1f}, J={self.model.J:.1f})")
+                        params_dirty = True
                     elif event.key == pygame.K_LEFT:
-                        self.model.J = max(0.1, self.model.J - 0.1)
+                        with self._model_lock:
+                            self.model.J = max(0.1, self.model.J - 0.1)
                         pygame.display.set_caption(f"Ising Model Simulation (T={self.model.temperature:.1f}, J={self.model.J:.1f})")
+                        params_dirty = True
+                    elif event.key == pygame.K_w:
+                        # Toggle between Metropolis and Wolff updates
+                        with self._model_lock:
+                            self.algorithm = ("wolff" if self.algorithm == "metropolis"
+                                              else "metropolis")
+                        params_dirty = True
                     elif event.key == pygame.K_s:
                         # Save a screenshot
                         self.save_screenshot()
                     elif event.key == pygame.K_r:
                         # Reset the lattice
-                        self.model.lattice = np.random.choice([-1, 1], size=(self.size, self.size))
-                        self.energies = [self.model.total_energy() / (self.size * self.size)]
-                        self.magnetizations = [self.model.magnetization()]
-                        self.sweep_count = 0
-                        
-            if not paused:
-                self.model.metropolis_sweep()
-                self.sweep_count += 1
-                step += 1
-                
-            # Always update the display
-            self.screen.fill(self.bg_color)
-            self.draw_lattice()
-            
-            # Always update plots (they're much more efficient now)
-            self.update_plots()
-            
-            # Draw stats
-            self.draw_stats()
-            
-            # Draw a line separating simulation and plots
-            pygame.draw.line(self.screen, (100, 100, 100), 
-                            (self.sim_width + 10, 0), 
-                            (self.sim_width + 10, self.height), 
-                            2)
-            
-            pygame.display.flip()
+                        with self._model_lock:
+                            self.model.randomize()
+                        with self._front_lock:
+                            np.copyto(self._front, self.model.lattice)
+                            self.sweep_count = 0
+                        self.energies = deque([self.model.E / (self.size * self.size)],
+                                              maxlen=self.max_data_points)
+                        self.magnetizations = deque([self.model.magnetization()],
+                                                    maxlen=self.max_data_points)
+                        last_drawn_sweep = 0
+                        last_plot_sweep = 0
+                        params_dirty = True
+
+            with self._front_lock:
+                current_sweep = self.sweep_count
+            new_sweep = current_sweep != last_drawn_sweep
+
+            # Sample the observables once per published sweep
+            if new_sweep:
+                with self._model_lock:
+                    self.energies.append(self.model.E / (self.size * self.size))
+                    self.magnetizations.append(self.model.magnetization())
+
+            # Redraw only the regions whose data changed; when the
+            # simulation is paused and no key was pressed, the frame
+            # costs nothing but the event poll
+            dirty_rects = []
+            if new_sweep or params_dirty:
+                self.screen.fill(self.bg_color, lattice_area)
+                self.draw_lattice()
+                self.draw_stats()
+                dirty_rects.append(lattice_area)
+                last_drawn_sweep = current_sweep
+            if params_dirty or (new_sweep and
+                                current_sweep - last_plot_sweep >= self.update_interval):
+                self.update_plots()
+                dirty_rects.append(plot_area)
+                last_plot_sweep = current_sweep
+            params_dirty = False
+
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
             clock.tick(30)  # Cap at 30 FPS
-            
+
+        # Shut down the worker before tearing pygame down
+        self._stop_ev.set()
+        self._running_ev.set()
+        worker.join(timeout=1.0)
         pygame.quit()
 
 
@@ -477,6 +873,9 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         size = int(sys.argv[1])
+        if size % 2:
+            size += 1
+            print(f"Odd sizes are not supported; using size={size}")
     if len(sys.argv) > 2:
         temperature = float(sys.argv[2])
     if len(sys.argv) > 3:
@@ -488,6 +887,7 @@ if __name__ == "__main__":
     print("  SPACE - Pause/Resume")
     print("  UP/DOWN - Increase/Decrease temperature")
     print("  LEFT/RIGHT - Decrease/Increase coupling constant J")
+    print("  W - Toggle between Metropolis and Wolff cluster updates")
     print("  S - Save screenshot")
     print("  R - Reset the simulation with a new random lattice")
     
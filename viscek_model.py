@@ -25,7 +25,7 @@ Usage
      pip install pygame numpy numba pygame-widgets
 
 2. Place a 30x30 (or larger) RGBA bird sprite named "bird.png" in the same
-   directory as this script (or adjust the path in Arrow.__init__).
+   directory as this script (or adjust the path where Arrow._sprite is set).
 
 3. Run the script:
      python viscek_model.py
@@ -37,8 +37,9 @@ Controls
 - Sliders: adjust noise and interaction radius at runtime.
 
 Performance notes
-- Numba @jit(nopython=True) is used for speed in the compute loops. The first
-  run will incur compilation overhead; subsequent frames will be much faster.
+- Numba @jit(nopython=True) is used for speed in the compute loops. Compiled
+  kernels are cached on disk (cache=True), so only the very first launch pays
+  the JIT compilation cost; later runs start at full speed.
 - Large numbers of agents or very large interaction radii will increase CPU
   load due to pairwise distance calculations. Consider reducing agent count or
   increasing delta_t / reducing FPS for less frequent updates.
@@ -47,6 +48,8 @@ Author / License
 - Minimal educational example; adapt freely for research or learning.
 """
 
+import math
+import os
 import pygame
 import sys
 import numpy as np
@@ -56,6 +59,13 @@ from pygame_widgets.textbox import TextBox
 import numba as nb
 from numba import jit, prange
 
+# Optional GPU backend: Taichi is only used when VICSEK_BACKEND=taichi,
+# so it stays a soft dependency
+try:
+    import taichi as ti
+except ImportError:
+    ti = None
+
 # Simulation Parameters
 delta_t = 0.1
 number_of_arrows = 200 # Number of arrows in the simulation
@@ -65,58 +75,168 @@ repulsion_strength = 100  # Strength of repulsion from mouse
 repulsion_radius = 100  # Radius within which arrows are repelled by the mouse
 
 # Numba accelerated functions
-@jit(nopython=True)
-def compute_directions(positions, angles, interaction_radius):
+@jit(nopython=True, parallel=True, cache=True, fastmath=True,
+     boundscheck=False, error_model='numpy')
+def compute_directions(positions, headings, interaction_radius, width, height):
+    """Average neighbor headings using a uniform spatial grid.
+
+    Agents are binned into cells of side interaction_radius, so each
+    agent only scans its own cell plus the 8 surrounding ones instead of
+    every other agent. That turns the neighbor search from O(N^2) into
+    O(N * average cell occupancy), which is what makes thousands of
+    agents feasible in real time. Headings are stored as unit vectors,
+    so alignment is a plain component sum with one normalization per
+    agent and no trig at all.
+    """
     n = len(positions)
-    new_angles = np.zeros(n)
-    
+    new_headings = np.zeros((n, 2))
+
+    # Grid dimensions; cells are at least interaction_radius wide so a
+    # 3x3 block of cells always covers the interaction disc
+    gx = max(1, int(width / interaction_radius))
+    gy = max(1, int(height / interaction_radius))
+    cell_w = width / gx
+    cell_h = height / gy
+
+    # Bin agents into cells (CSR layout: counting sort by cell id)
+    cell_id = np.empty(n, dtype=np.int64)
+    counts = np.zeros(gx * gy + 1, dtype=np.int64)
+    for i in range(n):
+        cx = min(gx - 1, max(0, int(positions[i, 0] / cell_w)))
+        cy = min(gy - 1, max(0, int(positions[i, 1] / cell_h)))
+        cid = cy * gx + cx
+        cell_id[i] = cid
+        counts[cid + 1] += 1
+    for c in range(1, gx * gy + 1):
+        counts[c] += counts[c - 1]
+    order = np.empty(n, dtype=np.int64)
+    fill = counts[:-1].copy()
     for i in range(n):
-        sin_sum = 0.0
-        cos_sum = 0.0
+        cid = cell_id[i]
+        order[fill[cid]] = i
+        fill[cid] += 1
+
+    r2 = interaction_radius * interaction_radius
+    for i in prange(n):
+        hx_sum = 0.0
+        hy_sum = 0.0
         count = 0
-        
-        for j in range(n):
-            # Calculate distance between arrows
-            dx = positions[i, 0] - positions[j, 0]
-            dy = positions[i, 1] - positions[j, 1]
-            dist = np.sqrt(dx*dx + dy*dy)
-            
-            if dist < interaction_radius:
-                angle_rad = np.radians(angles[j])
-                sin_sum += np.sin(angle_rad)
-                cos_sum += np.cos(angle_rad)
-                count += 1
-        
-        if count > 0:
-            avg_angle = np.degrees(np.arctan2(sin_sum/count, cos_sum/count))
-            new_angles[i] = avg_angle
+
+        cx = min(gx - 1, max(0, int(positions[i, 0] / cell_w)))
+        cy = min(gy - 1, max(0, int(positions[i, 1] / cell_h)))
+        for ny in range(max(0, cy - 1), min(gy, cy + 2)):
+            for nx in range(max(0, cx - 1), min(gx, cx + 2)):
+                cid = ny * gx + nx
+                for k in range(counts[cid], counts[cid + 1]):
+                    j = order[k]
+                    # Squared distance; comparing against r^2 avoids the sqrt
+                    dx = positions[i, 0] - positions[j, 0]
+                    dy = positions[i, 1] - positions[j, 1]
+                    if dx * dx + dy * dy < r2:
+                        hx_sum += headings[j, 0]
+                        hy_sum += headings[j, 1]
+                        count += 1
+
+        norm = np.sqrt(hx_sum * hx_sum + hy_sum * hy_sum)
+        if count > 0 and norm > 0.0:
+            new_headings[i, 0] = hx_sum / norm
+            new_headings[i, 1] = hy_sum / norm
         else:
-            new_angles[i] = angles[i]
-    
-    return new_angles
-
-@jit(nopython=True)
-def apply_mouse_repulsion(positions, velocities, mouse_pos, repulsion_radius, repulsion_strength, delta_t):
-    for i in range(len(positions)):
-        dx = positions[i, 0] - mouse_pos[0]
-        dy = positions[i, 1] - mouse_pos[1]
-        distance_to_mouse = np.sqrt(dx*dx + dy*dy)
-        
-        if distance_to_mouse < repulsion_radius and distance_to_mouse > 0:
-            repulsion_x = dx / distance_to_mouse * repulsion_strength
-            repulsion_y = dy / distance_to_mouse * repulsion_strength
-            velocities[i, 0] += repulsion_x * delta_t
-            velocities[i, 1] += repulsion_y * delta_t
-    
-    return velocities
+            new_headings[i, 0] = headings[i, 0]
+            new_headings[i, 1] = headings[i, 1]
 
-@jit(nopython=True)
-def update_positions(positions, velocities, delta_t, width, height):
-    for i in range(len(positions)):
-        positions[i, 0] = (positions[i, 0] + velocities[i, 0] * delta_t) % width
-        positions[i, 1] = (positions[i, 1] + velocities[i, 1] * delta_t) % height
-    
-    return positions
+    return new_headings
+
+@jit(nopython=True, parallel=True, cache=True, fastmath=True,
+     boundscheck=False, error_model='numpy')
+def step_agents(positions, headings, velocities, noise, mouse_x, mouse_y,
+                repulsion_radius, repulsion_strength, delta_t, width, height):
+    """Fused per-agent update: noise, velocity, mouse repulsion, integration.
+
+    Noise addition, the velocity recomputation, mouse repulsion and the
+    position integration used to be four separate passes over the agent
+    arrays (one of them pure Python). Doing them in one prange loop
+    streams each agent's state through registers exactly once, and the
+    repulsion uses squared distances so the sqrt only runs for agents
+    actually inside the repulsion radius. The noise draw happens inline
+    (numba keeps per-thread RNG state), so no noise array is allocated
+    per frame.
+    """
+    r2 = repulsion_radius * repulsion_radius
+    for i in prange(len(positions)):
+        # Noise is a small random rotation of the unit heading; the only
+        # trig left is the cos/sin of the noise angle itself
+        nr = np.radians(np.random.uniform(-noise, noise))
+        c = np.cos(nr)
+        s = np.sin(nr)
+        hx = headings[i, 0] * c - headings[i, 1] * s
+        hy = headings[i, 0] * s + headings[i, 1] * c
+        vx = hx * 20
+        vy = hy * 20
+
+        dx = positions[i, 0] - mouse_x
+        dy = positions[i, 1] - mouse_y
+        d2 = dx * dx + dy * dy
+        if d2 < r2 and d2 > 0:
+            inv_dist = 1.0 / np.sqrt(d2)
+            vx += dx * inv_dist * repulsion_strength * delta_t
+            vy += dy * inv_dist * repulsion_strength * delta_t
+
+        positions[i, 0] = (positions[i, 0] + vx * delta_t) % width
+        positions[i, 1] = (positions[i, 1] + vy * delta_t) % height
+        headings[i, 0] = hx
+        headings[i, 1] = hy
+        velocities[i, 0] = vx
+        velocities[i, 1] = vy
+
+def _make_taichi_backend():
+    """Build a Taichi alignment kernel and return a drop-in wrapper.
+
+    The kernel is a plain data-parallel all-pairs scan: on a GPU the
+    N^2 work is spread over thousands of threads, which is competitive
+    with the gridded CPU kernel well past N=10k and keeps the Taichi
+    side trivial. State is mirrored into ti fields per call.
+    """
+    ti.init(arch=ti.gpu)
+    n = number_of_arrows
+    pos_f = ti.Vector.field(2, dtype=ti.f32, shape=n)
+    head_f = ti.Vector.field(2, dtype=ti.f32, shape=n)
+    out_f = ti.Vector.field(2, dtype=ti.f32, shape=n)
+
+    @ti.kernel
+    def _align(radius: ti.f32):
+        for i in range(n):
+            acc = ti.Vector([0.0, 0.0])
+            count = 0
+            for j in range(n):
+                d = pos_f[i] - pos_f[j]
+                if d.dot(d) < radius * radius:
+                    acc += head_f[j]
+                    count += 1
+            norm = acc.norm()
+            if count > 0 and norm > 0:
+                out_f[i] = acc / norm
+            else:
+                out_f[i] = head_f[i]
+
+    def compute(positions, headings, interaction_radius, width, height):
+        pos_f.from_numpy(positions.astype(np.float32))
+        head_f.from_numpy(headings.astype(np.float32))
+        _align(float(interaction_radius))
+        return out_f.to_numpy().astype(np.float64)
+
+    return compute
+
+
+# Alignment backend selection; numba stays the default so no new hard
+# dependency is introduced
+VICSEK_BACKEND = os.environ.get("VICSEK_BACKEND", "numba").lower()
+if VICSEK_BACKEND == "taichi":
+    if ti is None:
+        raise RuntimeError("VICSEK_BACKEND=taichi requires Taichi (pip install taichi)")
+    _compute_directions = _make_taichi_backend()
+else:
+    _compute_directions = compute_directions
 
 ##############################################################################################################
 # Viscek Model
@@ -124,29 +244,49 @@ def update_positions(positions, velocities, delta_t, width, height):
 
 
 class Arrow:
-    def __init__(self, x, y, angle):
-        self.x = x
-        self.y = y
-        self.angle = angle
+    """Thin rendering view onto one row of the shared state arrays.
+
+    All simulation state lives in the module-level SoA arrays
+    (positions, headings, velocities); an Arrow only knows its index and
+    how to draw itself.
+    """
+    # The bird sprite is loaded and converted once (after the display
+    # exists) and shared by every arrow; see the assignment below
+    # pygame.display.set_mode
+    _sprite = None
+
+    # Rotated sprites cached per 5-degree bucket, shared by all arrows:
+    # at most 72 rotations ever happen instead of N per frame
+    _rot_cache = {}
+
+    def __init__(self, index):
+        self.index = index
         self.radius = 10
-        self.pos = np.asarray((self.x, self.y))
-        self.vel = np.asarray([np.cos(np.radians(self.angle)), np.sin(np.radians(self.angle))]) * 20
-        
-        # Load the bird image
-        self.original_image = pygame.image.load("bird.png").convert_alpha()
-        # You might want to scale the image to an appropriate size
-        self.original_image = pygame.transform.scale(self.original_image, (30, 30))
-        self.image = self.original_image
-        
-    def display(self, surface):
-        # Rotate the image according to the bird's angle
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
-        
+
+    def blit_entry(self):
+        """Return this arrow's (image, rect) pair for a batched blits call."""
+        # Recover the angle from the unit heading only here, for the
+        # sprite rotation -- O(N) trig total instead of O(N^2)
+        angle = math.degrees(math.atan2(headings[self.index, 1],
+                                        headings[self.index, 0]))
+
+        # Round to the nearest cached rotation; 5 degrees is below what
+        # the eye picks up on a 30px sprite
+        bucket = int(angle) % 360 // 5 * 5
+        image = Arrow._rot_cache.get(bucket)
+        if image is None:
+            image = pygame.transform.rotate(Arrow._sprite, -bucket)
+            Arrow._rot_cache[bucket] = image
+
         # Get the rect for positioning (centered on the bird's position)
-        rect = self.image.get_rect(center=(self.x, self.y))
-        
+        rect = image.get_rect(
+            center=(positions[self.index, 0], positions[self.index, 1])
+        )
+        return image, rect
+
+    def display(self, surface):
         # Draw the image onto the surface
-        surface.blit(self.image, rect)
+        surface.blit(*self.blit_entry())
 
 ##############################################################################################################
 # All the Pygame related code goes below this line
@@ -163,6 +303,11 @@ BACKGROUND_COLOR = (30, 30, 30)  # Dark gray
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Viscek Model Simulation")
 
+# Load the bird sprite once, now that convert_alpha can match the
+# display's pixel format; every Arrow shares this one surface
+Arrow._sprite = pygame.transform.scale(
+    pygame.image.load("bird.png").convert_alpha(), (30, 30))
+
 # Clock to control frame rate
 clock = pygame.time.Clock()
 
@@ -179,64 +324,50 @@ radius_text.disable()  # Make it read-only
 radius_label = TextBox(screen, 50, 60, 150, 20, fontSize=16, textColour=(255, 255, 255), colour=BACKGROUND_COLOR)
 radius_label.setText("Interaction Radius")
 
-# Initialize the Objects
-list_of_arrows = []
-for i in range(number_of_arrows):
-    x = np.random.randint(0, WIDTH)
-    y = np.random.randint(0, HEIGHT)
-    angle = np.random.randint(0, 360)
-    arrow = Arrow(x, y, angle)
-    list_of_arrows.append(arrow)
+# Agent state as structure-of-arrays: allocated once and updated in
+# place every frame, so nothing is marshalled between Python objects
+# and NumPy per frame
+positions = np.empty((number_of_arrows, 2), dtype=np.float64)
+positions[:, 0] = np.random.randint(0, WIDTH, number_of_arrows)
+positions[:, 1] = np.random.randint(0, HEIGHT, number_of_arrows)
+# Headings as unit vectors: the alignment step becomes a plain vector
+# average with no degrees<->radians round-trips in the hot path
+_init = np.radians(np.random.randint(0, 360, number_of_arrows).astype(np.float64))
+headings = np.column_stack((np.cos(_init), np.sin(_init)))
+velocities = headings * 20.0
+
+# Initialize the rendering objects
+list_of_arrows = [Arrow(i) for i in range(number_of_arrows)]
 
 def update(screen, interaction_radius, noise):
+    # Mouse position as two scalars; numba keeps them in registers and
+    # no 2-element array is allocated per frame
     mouse_x, mouse_y = pygame.mouse.get_pos()
-    mouse_pos = np.array([mouse_x, mouse_y], dtype=np.float64)
-    
-    # Extract positions, angles, and velocities for Numba processing
-    positions = np.array([[arrow.x, arrow.y] for arrow in list_of_arrows], dtype=np.float64)
-    angles = np.array([arrow.angle for arrow in list_of_arrows], dtype=np.float64)
-    velocities = np.array([arrow.vel for arrow in list_of_arrows], dtype=np.float64)
-    
-    # Compute new directions with Numba
-    new_angles = compute_directions(positions, angles, interaction_radius)
-    
-    # Apply noise
-    new_angles += np.random.uniform(-noise, noise, len(new_angles))
-    
-    # Update velocities based on new angles
-    for i, angle in enumerate(new_angles):
-        velocities[i] = np.array([np.cos(np.radians(angle)), np.sin(np.radians(angle))]) * 20
-    
-    # Apply mouse repulsion with Numba
-    velocities = apply_mouse_repulsion(positions, velocities, mouse_pos, repulsion_radius, repulsion_strength, delta_t)
-    
-    # Update positions with Numba
-    positions = update_positions(positions, velocities, delta_t, WIDTH, HEIGHT)
-    
-    # Update arrow objects
-    for i, arrow in enumerate(list_of_arrows):
-        arrow.x = positions[i, 0]
-        arrow.y = positions[i, 1]
-        arrow.pos = positions[i]
-        arrow.angle = new_angles[i]
-        arrow.vel = velocities[i]
-        
-        # Display arrow
-        arrow.display(screen)
+
+    # Compute new directions with the selected backend
+    headings[:] = _compute_directions(positions, headings, interaction_radius, WIDTH, HEIGHT)
+
+    # Noise, velocities, mouse repulsion and integration in one fused kernel
+    step_agents(positions, headings, velocities, float(noise), float(mouse_x), float(mouse_y),
+                repulsion_radius, repulsion_strength, delta_t, WIDTH, HEIGHT)
+
+    # Display arrows with one batched blit call instead of N
+    screen.blits([arrow.blit_entry() for arrow in list_of_arrows],
+                 doreturn=False)
 
 
 def scatter_arrows():
-    """Randomly repositions all arrows on the screen."""
-    for arrow in list_of_arrows:
-        # Set random position
-        arrow.x = np.random.randint(0, WIDTH)
-        arrow.y = np.random.randint(0, HEIGHT)
-        arrow.pos = np.array([arrow.x, arrow.y])
-        
-        # Set random angle
-        arrow.angle = np.random.randint(0, 360)
-        arrow.vel = np.array([np.cos(np.radians(arrow.angle)), np.sin(np.radians(arrow.angle))]) * 20
-                            
+    """Randomly repositions all arrows on the screen (vectorized)."""
+    # Random positions
+    positions[:, 0] = np.random.uniform(0, WIDTH, number_of_arrows)
+    positions[:, 1] = np.random.uniform(0, HEIGHT, number_of_arrows)
+
+    # Random headings
+    a = np.random.uniform(0, 2 * np.pi, number_of_arrows)
+    headings[:, 0] = np.cos(a)
+    headings[:, 1] = np.sin(a)
+    velocities[:] = headings * 20.0
+
 
 def main():
     running = True